@@ -8,7 +8,6 @@ import collections
 import jinja2
 import os
 import pathlib
-import shutil
 import toml
 
 
@@ -17,15 +16,14 @@ META_HINT = """\
 # https://github.com/zopefoundation/meta/tree/master/config/{config_type}
 """
 
-def copy_with_meta(template_name, destination, config_type, **kw):
-    """Copy the source file to destination and a hint of origin.
+def copy_with_meta(template_name, destination, config_type, hint, **kw):
+    """Render the template to destination and add `hint` as hint of origin.
 
     If kwargs are given they are used as template arguments.
     """
-    with open(destination, 'w') as f_:
-        f_.write(META_HINT.format(config_type=config_type))
-        template = jinja_env.get_template(template_name)
-        f_.write(template.render(config_type=config_type, **kw))
+    template = jinja_env.get_template(template_name)
+    destination.write_text(
+        hint + template.render(config_type=config_type, **kw))
 
 
 parser = argparse.ArgumentParser(
@@ -91,15 +89,22 @@ parser.add_argument(
 
 args = parser.parse_args()
 path = args.path
-default_path = pathlib.Path(__file__).parent / 'default'
+config_path = pathlib.Path(__file__).parent
+default_path = config_path / 'default'
 
-if not (path / '.git').exists():
+# List the repository once instead of checking for each file separately:
+try:
+    repository_files = set(os.listdir(path))
+except (FileNotFoundError, NotADirectoryError):
+    repository_files = set()
+
+if '.git' not in repository_files:
     raise ValueError('`path` does not point to a git clone of a repository!')
 
 
 # Read and update meta configuration
 meta_toml_path = path / '.meta.toml'
-if meta_toml_path.exists():
+if '.meta.toml' in repository_files:
     meta_cfg = toml.load(meta_toml_path)
     meta_cfg = collections.defaultdict(dict, **meta_cfg)
 else:
@@ -111,10 +116,11 @@ if config_type is None:
     raise ValueError(
         'Configuration type not set. Please use `--type` to select it.')
 meta_cfg['meta']['template'] = config_type
+meta_hint = META_HINT.format(config_type=config_type)
 
-config_type_path = pathlib.Path(__file__).parent / config_type
+config_type_path = config_path / config_type
 with open(config_type_path / 'packages.txt') as f:
-    known_packages = f.read().splitlines()
+    known_packages = set(f.read().splitlines())
 
 if path.name in known_packages:
     print(f'{path.name} is already configured for this config type, updating.')
@@ -157,13 +163,13 @@ additional_check_manifest_ignores = meta_cfg['check-manifest'].get(
 check_manifest_ignore_bad_ideas = meta_cfg['check-manifest'].get(
     'ignore-bad-ideas', [])
 copy_with_meta(
-    'setup.cfg.j2', path / 'setup.cfg', config_type,
+    'setup.cfg.j2', path / 'setup.cfg', config_type, meta_hint,
     additional_flake8_config=additional_flake8_config,
     additional_check_manifest_ignores=additional_check_manifest_ignores,
     check_manifest_ignore_bad_ideas=check_manifest_ignore_bad_ideas,
     with_docs=with_docs, with_sphinx_doctests=with_sphinx_doctests)
-copy_with_meta('editorconfig', path / '.editorconfig', config_type)
-copy_with_meta('gitignore', path / '.gitignore', config_type)
+copy_with_meta('editorconfig', path / '.editorconfig', config_type, meta_hint)
+copy_with_meta('gitignore', path / '.gitignore', config_type, meta_hint)
 workflows = path / '.github' / 'workflows'
 workflows.mkdir(parents=True, exist_ok=True)
 
@@ -171,10 +177,10 @@ add_coveragerc = False
 rm_coveragerc = False
 if (config_type_path / 'coveragerc.j2').exists():
     copy_with_meta(
-        'coveragerc.j2', path / '.coveragerc', config_type,
+        'coveragerc.j2', path / '.coveragerc', config_type, meta_hint,
         package_name=path.name)
     add_coveragerc = True
-elif (path / '.coveragerc').exists():
+elif '.coveragerc' in repository_files:
     rm_coveragerc = True
 
 
@@ -182,13 +188,13 @@ coverage_run_additional_config = meta_cfg['coverage-run'].get(
     'additional-config', [])
 fail_under = meta_cfg['coverage'].setdefault('fail-under', 0)
 copy_with_meta(
-    'tox.ini.j2', path / 'tox.ini', config_type,
+    'tox.ini.j2', path / 'tox.ini', config_type, meta_hint,
     fail_under=fail_under, with_pypy=with_pypy,
     with_legacy_python=with_legacy_python,
     with_docs=with_docs, with_sphinx_doctests=with_sphinx_doctests,
     coverage_run_additional_config=coverage_run_additional_config)
 copy_with_meta(
-    'tests.yml.j2', workflows / 'tests.yml', config_type,
+    'tests.yml.j2', workflows / 'tests.yml', config_type, meta_hint,
     with_pypy=with_pypy, with_legacy_python=with_legacy_python,
     with_docs=with_docs)
 
@@ -196,55 +202,55 @@ copy_with_meta(
 # Modify MANIFEST.in with meta options
 additional_manifest_rules = meta_cfg['manifest'].get('additional-rules', [])
 copy_with_meta(
-    'MANIFEST.in.j2', path / 'MANIFEST.in', config_type,
+    'MANIFEST.in.j2', path / 'MANIFEST.in', config_type, meta_hint,
     additional_rules=additional_manifest_rules,
     with_docs=with_docs, with_appveyor=with_appveyor)
 
 
 if with_appveyor:
     copy_with_meta(
-        'appveyor.yml.j2', path / 'appveyor.yml', config_type,
+        'appveyor.yml.j2', path / 'appveyor.yml', config_type, meta_hint,
         with_legacy_python=with_legacy_python)
 
 
 branch_name = args.branch_name or f'config-with-{config_type}'
 with change_dir(path) as cwd:
-    if pathlib.Path('bootstrap.py').exists():
-        call('git', 'rm', 'bootstrap.py')
-    if pathlib.Path('.travis.yml').exists():
-        call('git', 'rm', '.travis.yml')
+    rm_files = []
+    add_files = [
+        'setup.cfg', 'tox.ini', '.gitignore', '.github/workflows/tests.yml',
+        'MANIFEST.in', '.editorconfig', '.meta.toml']
+    if 'bootstrap.py' in repository_files:
+        rm_files.append('bootstrap.py')
+    if '.travis.yml' in repository_files:
+        rm_files.append('.travis.yml')
     if rm_coveragerc:
-        call('git', 'rm', '.coveragerc')
+        rm_files.append('.coveragerc')
+    if rm_files:
+        call('git', 'rm', '--ignore-unmatch', *rm_files)
     if add_coveragerc:
-        call('git', 'add', '.coveragerc')
+        add_files.append('.coveragerc')
     if with_appveyor:
-        call('git', 'add', 'appveyor.yml')
+        add_files.append('appveyor.yml')
     # Remove empty sections:
     meta_cfg = {k: v  for k, v in meta_cfg.items() if v}
-    with open('.meta.toml', 'w') as meta_f:
-        meta_f.write(
-            '# Generated from:\n'
-            '# https://github.com/zopefoundation/meta/tree/master/config/'
-            f'{config_type}\n')
-        toml.dump(
-            meta_cfg, meta_f,
+    pathlib.Path('.meta.toml').write_text(
+        meta_hint + toml.dumps(
+            meta_cfg,
             TomlArraySeparatorEncoderWithNewline(
-                separator=',\n   ', indent_first_line=True))
+                separator=',\n   ', indent_first_line=True)))
 
     call(pathlib.Path(cwd) / 'bin' / 'tox', '-p', 'auto')
 
-    branches = call(
+    branches = frozenset(call(
         'git', 'branch', '--format', '%(refname:short)',
-        capture_output=True).stdout.splitlines()
+        capture_output=True).stdout.splitlines())
     if branch_name in branches:
         call('git', 'checkout', branch_name)
         updating = True
     else:
         call('git', 'checkout', '-b', branch_name)
         updating = False
-    call('git', 'add',
-         'setup.cfg', 'tox.ini', '.gitignore', '.github/workflows/tests.yml',
-         'MANIFEST.in', '.editorconfig', '.meta.toml')
+    call('git', 'add', *add_files)
     if not fail_under:
         print('In .meta.toml in section [coverage] the option "fail-under" is'
               ' 0. Please enter a valid minimum coverage and rerun.')
@@ -5,7 +5,6 @@ from shared.path import change_dir
 from shared.toml_encoder import TomlArraySeparatorEncoderWithNewline
 import argparse
 import collections
-import os
 import pathlib
 import sys
 import toml
@@ -65,19 +64,18 @@ if check_manifest:
 
 branch_name = f'covert.meta.cfg-to-.meta.toml'
 with change_dir(path) as cwd:
-    with open('.meta.toml', 'w') as meta_f:
-        meta_f.write(
-            '# Generated from:\n'
-            '# https://github.com/zopefoundation/meta/tree/master/config/'
-            f'{src["template"]}\n')
-        toml.dump(
-            dest, meta_f,
+    pathlib.Path('.meta.toml').write_text(
+        '# Generated from:\n'
+        '# https://github.com/zopefoundation/meta/tree/master/config/'
+        f'{src["template"]}\n'
+        + toml.dumps(
+            dest,
             TomlArraySeparatorEncoderWithNewline(
-                separator=',\n   ', indent_first_line=True))
+                separator=',\n   ', indent_first_line=True)))
 
-    branches = call(
+    branches = frozenset(call(
         'git', 'branch', '--format', '%(refname:short)',
-        capture_output=True).stdout.splitlines()
+        capture_output=True).stdout.splitlines())
     if branch_name in branches:
         call('git', 'checkout', branch_name)
         updating = True
@@ -15,8 +15,9 @@ def call(*args, capture_output=False, cwd=None):
 
     If it fails exit the process.
     """
+    # Text mode is only needed to decode captured output:
     result = subprocess.run(
-        args, capture_output=capture_output, text=True, cwd=cwd)
+        args, capture_output=capture_output, text=capture_output, cwd=cwd)
     if result.returncode != 0:
         abort(result.returncode)
     return result